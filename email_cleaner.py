@@ -1,11 +1,46 @@
+import io
 import os
 import re
+import sys
+import queue
 import shutil
 import logging
+import threading
+import weakref
 import argparse
 import configparser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windowsではfcntlを利用できない
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# 文の区切り、空白の置換に使う正規表現
+# （句点の後の空白はすべて句点側で改行にするため、空白の置換は改行を対象にしない）
+_SENTENCE_RE = re.compile(r'。(?:[\s　]+|(?=[^」』）】}\]\)>"\']))')
+_WS_RE = re.compile(r'[^\S\n]+')
+
+# ファイルを逐次読み書きする際のバッファサイズ
+_IO_BUFFER_SIZE = 1 << 17
+
+# 逐次整形でまとめて正規表現を適用する引用行の文字数の目安
+_BATCH_SIZE = 1 << 16
+
+# Linuxでファイルの内容を共有コピー（reflink）するioctl番号
+_FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+# スレッドによるパイプライン処理で先読み・書き込み待ちにできるファイル数
+_PIPELINE_DEPTH = 2
+
+# 引用行のないテキストを整形したときの警告メッセージ
+_NO_QUOTE_WARNING = "引用行（>で始まる行）が見つかりませんでした"
 
 
 class EmailCleanerConfig:
@@ -31,7 +66,9 @@ class EmailCleanerConfig:
         }
         self.config['processing'] = {
             'encoding': 'utf-8',
-            'backup_original': 'true'
+            'backup_original': 'true',
+            'executor': 'process',
+            'backup_mode': 'copy'
         }
         self.config['keywords'] = {
             'list': '記、件名、宛先、差出人'
@@ -39,23 +76,320 @@ class EmailCleanerConfig:
         
         with open(self.config_file, 'w', encoding='utf-8') as f:
             self.config.write(f)
-        logging.info(f"デフォルト設定ファイル '{self.config_file}' を作成しました")
+        logger.info(f"デフォルト設定ファイル '{self.config_file}' を作成しました")
     
-    def get_input_dir(self) -> str:
-        return self.config.get('paths', 'input_dir', fallback='input')
+    # 設定値は処理中に何度も参照されるため、初回アクセス時の値を保持する
+    @cached_property
+    def input_dir(self) -> Path:
+        return Path(self.config.get('paths', 'input_dir', fallback='input'))
     
-    def get_output_dir(self) -> str:
-        return self.config.get('paths', 'output_dir', fallback='output')
+    @cached_property
+    def output_dir(self) -> Path:
+        return Path(self.config.get('paths', 'output_dir', fallback='output'))
     
-    def get_encoding(self) -> str:
+    @cached_property
+    def encoding(self) -> str:
         return self.config.get('processing', 'encoding', fallback='utf-8')
     
-    def get_keywords(self) -> List[str]:
+    @cached_property
+    def keywords(self) -> Tuple[str, ...]:
         keywords_str = self.config.get('keywords', 'list', fallback='')
-        return [kw.strip() for kw in keywords_str.split(',') if kw.strip()]
+        return tuple(kw.strip() for kw in keywords_str.split(',') if kw.strip())
+    
+    @cached_property
+    def keyword_pattern(self) -> Optional[re.Pattern]:
+        return _compile_keyword_pattern(self.keywords)
     
-    def should_backup(self) -> bool:
+    @cached_property
+    def backup_original(self) -> bool:
         return self.config.getboolean('processing', 'backup_original', fallback=True)
+    
+    @cached_property
+    def backup_mode(self) -> str:
+        return self.config.get('processing', 'backup_mode', fallback='copy').strip().lower()
+    
+    @cached_property
+    def executor(self) -> str:
+        return self.config.get('processing', 'executor', fallback='process').strip().lower()
+
+
+@lru_cache(maxsize=None)
+def _compile_keyword_pattern(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """キーワードをまとめて検索する正規表現を作成する（キーワードがない場合はNone）"""
+    if not keywords:
+        return None
+    # 長いキーワードを優先して一致させる。直前の改行も含めて置き換えることで、
+    # 空白から変換した改行と合わせて空行が2行以上にならないようにする
+    alternation = '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    return re.compile(f'\n?({alternation})')
+
+
+def clean_quoted_stream(lines: Iterable[str],
+                        keyword_pattern: Optional[re.Pattern] = None,
+                        warnings: Optional[List[str]] = None) -> Iterator[str]:
+    """
+    行単位で引用テキストを整形し、整形結果を順に返す
+    
+    整形は行ごとに完結するため、ファイル全体をメモリに読み込まずに処理できる。
+    ただし引用行が見つかるまでの行は、引用行がなかった場合に備えて保持する
+    
+    Args:
+        lines: 整形対象の行（改行文字付きでもよい）
+        keyword_pattern: 前に空行を入れるキーワードの正規表現
+        warnings: 警告メッセージの追加先（Noneの場合はログに出力する）
+        
+    Yields:
+        整形されたテキストの断片
+    """
+    pending: Optional[List[str]] = []
+    batch: List[str] = []
+    batch_size = 0
+    started = False
+    
+    def format_batch() -> str:
+        # 正規表現の呼び出し回数を減らすため、複数行をまとめて整形する
+        nonlocal started
+        # 行は前後の空白を除いてあるため、改行で連結すればそのまま出力の改行になる
+        piece = '\n'.join(batch)
+        batch.clear()
+        
+        # 句点（。＋空白）で改行（ただし閉じ括弧直前は除外）
+        piece = _SENTENCE_RE.sub('。\n', piece)
+        
+        # 行内の半角・全角スペースを改行に置き換える（連続する空白は1つの改行になる）
+        piece = _WS_RE.sub('\n', piece)
+        
+        # キーワードの前に空行を入れる（空行は最大1行）
+        if keyword_pattern is not None:
+            piece = keyword_pattern.sub(r'\n\n\1', piece)
+        
+        # まとまりの境目の改行は、キーワードで始まる場合だけ空行にする
+        body = piece.lstrip('\n')
+        if not started:
+            started = True
+            return body
+        if len(body) < len(piece):
+            return '\n\n' + body
+        return '\n' + body
+    
+    for chunk in lines:
+        if pending is not None:
+            pending.append(chunk)
+        
+        # ファイルの行は\nでしか区切られないため、str.splitlines()と同じ単位に分ける
+        for line in chunk.splitlines():
+            # 「>」付きの行だけを抽出し、同じ走査で引用記号を除去する
+            # （先頭の固定文字の判定なので正規表現は使わない）
+            stripped = line.lstrip()
+            if not stripped.startswith('>'):
+                continue
+            pending = None
+            # 「>」の後の空白（「>   本文」など）も除く必要があるため、rstrip()ではなく
+            # strip()を使う（strip()は両端の空白だけを走査するので追加のコストは小さい）
+            cleaned_line = stripped.lstrip('>').strip()
+            if not cleaned_line:  # 空行は除外
+                continue
+            
+            batch.append(cleaned_line)
+            batch_size += len(cleaned_line)
+            if batch_size >= _BATCH_SIZE:
+                yield format_batch()
+                batch_size = 0
+    
+    if batch:
+        yield format_batch()
+    
+    if pending is not None:
+        text = ''.join(pending).strip()
+        if text:
+            _warn(_NO_QUOTE_WARNING, warnings)
+        yield text
+
+
+def clean_quoted_text(text: str, keyword_pattern: Optional[re.Pattern] = None,
+                      warnings: Optional[List[str]] = None) -> str:
+    """
+    引用テキストを整形する
+    
+    Args:
+        text: 整形対象のテキスト
+        keyword_pattern: 前に空行を入れるキーワードの正規表現
+        warnings: 警告メッセージの追加先（Noneの場合はログに出力する）
+        
+    Returns:
+        整形されたテキスト
+    """
+    if not text.strip():
+        return ""
+    
+    # 「>」を含まないテキストは行分割せずにそのまま返す
+    if '>' not in text:
+        _warn(_NO_QUOTE_WARNING, warnings)
+        return text.strip()
+    
+    try:
+        return ''.join(clean_quoted_stream(text.splitlines(keepends=True), keyword_pattern,
+                                           warnings))
+        
+    except Exception as e:
+        logger.error(f"テキスト整形中にエラーが発生しました: {e}")
+        return text  # エラー時は元のテキストを返す
+
+
+def _warn(message: str, warnings: Optional[List[str]]):
+    """警告を追加先のリストに記録する（追加先がない場合はログに出力する）"""
+    if warnings is None:
+        logger.warning(message)
+    else:
+        warnings.append(message)
+
+
+def _read_file(path: Path, encoding: str) -> str:
+    """ファイル全体をテキストとして読み込む"""
+    return path.read_text(encoding=encoding)
+
+
+def _write_file(path: Path, text: str, encoding: str):
+    """テキストをファイルに書き込む"""
+    path.write_text(text, encoding=encoding)
+
+
+def _is_same_file(path1: Path, path2: Path) -> bool:
+    """2つのパスが同じファイルを指しているかどうか（どちらかが存在しない場合はFalse）"""
+    try:
+        return os.path.samefile(path1, path2)
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _can_detect_quote_bytes(encoding: str) -> bool:
+    """エンコード後のバイト列から「>」の有無を判定できるエンコーディングかどうか"""
+    try:
+        return b'>' in '>'.encode(encoding)
+    except LookupError:
+        return False
+
+
+def _stream_file(input_path: Path, output_path: Path, encoding: str,
+                 keyword_pattern: Optional[re.Pattern]) -> List[str]:
+    """
+    入力ファイルを行単位で整形しながら出力ファイルに書き込む
+    
+    Returns:
+        整形中の警告メッセージのリスト
+    """
+    warnings: List[str] = []
+    if _is_same_file(input_path, output_path):
+        # 出力ファイルを開くと入力ファイルも空になるため、全体を読み込んでから書き込む
+        text = _read_file(input_path, encoding)
+        _write_file(output_path, clean_quoted_text(text, keyword_pattern, warnings), encoding)
+        return warnings
+    
+    with open(input_path, "rb", buffering=_IO_BUFFER_SIZE) as raw:
+        if _can_detect_quote_bytes(encoding):
+            # 先頭のチャンクだけでファイル全体を読み終え、「>」のバイトを含まない場合は
+            # 整形せず、前後の空白だけを除いて出力する（bytesの検索はmemchrで行われるため、
+            # デコードや行分割よりも大幅に速い）
+            head = raw.read(_IO_BUFFER_SIZE)
+            if len(head) < _IO_BUFFER_SIZE and b'>' not in head:
+                # 改行コードの変換はテキストモードでの読み込みに合わせる
+                text = io.TextIOWrapper(io.BytesIO(head), encoding=encoding).read().strip()
+                if text:
+                    _warn(_NO_QUOTE_WARNING, warnings)
+                _write_file(output_path, text, encoding)
+                return warnings
+            # ファイルを開き直さずに先頭へ戻し、同じファイルから逐次整形する
+            raw.seek(0)
+        
+        infile = io.TextIOWrapper(raw, encoding=encoding)
+        with open(output_path, "w", encoding=encoding, buffering=_IO_BUFFER_SIZE) as outfile:
+            try:
+                outfile.writelines(clean_quoted_stream(infile, keyword_pattern, warnings))
+            except BaseException:
+                # 途中まで書き込んだ出力ファイルを残さない
+                outfile.close()
+                output_path.unlink()
+                raise
+    return warnings
+
+
+def _backup_file(src: Path, dst: Path, mode: str):
+    """
+    ファイルをバックアップする
+    
+    hardlinkはハードリンク、reflinkは共有コピー（btrfs/XFSなど）を作成し、
+    データの複製を避ける。作成できない場合や copy 指定時は通常のコピーを行う
+    
+    Args:
+        src: バックアップ元のファイル
+        dst: バックアップ先のファイル
+        mode: バックアップ方法（copy / hardlink / reflink）
+    """
+    if mode == 'hardlink':
+        try:
+            dst.unlink(missing_ok=True)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # 別のファイルシステム上などではコピーする
+    elif mode == 'reflink' and fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            # 以前にハードリンクで作成したバックアップを開くと元ファイルも空になるため、
+            # 先に削除してから作成する
+            dst.unlink(missing_ok=True)
+            with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # reflink非対応のファイルシステムではコピーする
+    
+    try:
+        shutil.copy2(src, dst)
+    except shutil.SameFileError:
+        # 以前にハードリンクで作成したバックアップは置き換える
+        dst.unlink()
+        shutil.copy2(src, dst)
+
+
+def _process_one(input_dir: Path, output_dir: Path, encoding: str,
+                 keywords: Tuple[str, ...],
+                 filename: str) -> Tuple[str, Optional[str], List[str]]:
+    """
+    単一ファイルを読み込み、整形して書き出す（プロセスプールのワーカーからも呼ばれる）
+    
+    Args:
+        input_dir: 入力ディレクトリ
+        output_dir: 出力ディレクトリ
+        encoding: 文字エンコーディング
+        keywords: 前に空行を入れるキーワード
+        filename: 処理対象のファイル名
+        
+    Returns:
+        (ファイル名, エラーメッセージ, 警告メッセージのリスト)のタプル。
+        成功時のエラーメッセージはNone。ワーカーではログの出力先が設定されて
+        いない場合があるため、警告はログに出力せずに呼び出し元へ返す
+    """
+    try:
+        # 読み込み・整形・書き込みを行単位で逐次行う
+        warnings = _stream_file(input_dir / filename, output_dir / filename, encoding,
+                                _compile_keyword_pattern(keywords))
+        return filename, None, warnings
+        
+    except Exception as e:
+        return filename, _describe_error(e, filename, encoding), []
+
+
+def _describe_error(error: Exception, filename: str, encoding: str) -> str:
+    """ファイル処理中の例外をログ用のメッセージに変換する"""
+    if isinstance(error, FileNotFoundError):
+        return f"ファイルが見つかりません: {filename}"
+    if isinstance(error, PermissionError):
+        return f"ファイルアクセス権限がありません: {filename}"
+    if isinstance(error, UnicodeDecodeError):
+        return f"文字エンコーディングエラー: {filename} (エンコーディング: {encoding})"
+    return f"'{filename}' の処理中に予期しないエラーが発生しました: {error}"
 
 
 class EmailCleaner:
@@ -63,7 +397,7 @@ class EmailCleaner:
     
     def __init__(self, config: EmailCleanerConfig):
         self.config = config
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.processed_count = 0
         self.error_count = 0
     
@@ -77,52 +411,7 @@ class EmailCleaner:
         Returns:
             整形されたテキスト
         """
-        if not text.strip():
-            return ""
-        
-        try:
-            lines = text.splitlines()
-            
-            # 「>」付きの行だけを対象に整形対象として抽出
-            quoted_lines = [line for line in lines if re.match(r'^\s*>+', line)]
-            
-            if not quoted_lines:
-                self.logger.warning("引用行（>で始まる行）が見つかりませんでした")
-                return text.strip()
-            
-            # 引用行から引用記号を除去
-            cleaned_lines = []
-            for line in quoted_lines:
-                cleaned_line = re.sub(r'^\s*>+\s?', '', line).strip()
-                if cleaned_line:  # 空行は除外
-                    cleaned_lines.append(cleaned_line)
-            
-            if not cleaned_lines:
-                return ""
-            
-            # 行を連結して、句点（。＋空白）で改行（ただし閉じ括弧直前は除外）
-            joined_text = ' '.join(cleaned_lines)
-            
-            # より包括的な閉じ括弧の処理
-            joined_text = re.sub(r'。[\s　]*(?=[^」』）】}\]\)>"\'])', '。\n', joined_text)
-            
-            # 半角・全角スペースを改行に置き換える
-            joined_text = re.sub(r'[\s　]+', '\n', joined_text)
-
-            # キーワードの前に空行を入れる
-            keywords = self.config.get_keywords()
-            for kw in keywords:
-                if kw in joined_text:
-                    joined_text = joined_text.replace(kw, f"\n\n{kw}")
-            
-            # 複数の連続する空行を2行に制限
-            joined_text = re.sub(r'\n{3,}', '\n\n', joined_text)
-            
-            return joined_text.strip()
-            
-        except Exception as e:
-            self.logger.error(f"テキスト整形中にエラーが発生しました: {e}")
-            return text  # エラー時は元のテキストを返す
+        return clean_quoted_text(text, self.config.keyword_pattern)
     
     def create_directories(self) -> bool:
         """
@@ -132,8 +421,8 @@ class EmailCleaner:
             作成成功時True、失敗時False
         """
         try:
-            input_dir = Path(self.config.get_input_dir())
-            output_dir = Path(self.config.get_output_dir())
+            input_dir = self.config.input_dir
+            output_dir = self.config.output_dir
             
             input_dir.mkdir(exist_ok=True)
             output_dir.mkdir(exist_ok=True)
@@ -153,9 +442,11 @@ class EmailCleaner:
             テキストファイル名のリスト
         """
         try:
-            input_dir = Path(self.config.get_input_dir())
-            txt_files = [f.name for f in input_dir.iterdir() 
-                        if f.is_file() and f.suffix.lower() == '.txt']
+            # DirEntryはディレクトリ走査時の種別情報を保持しているため、
+            # ファイルごとのstat呼び出しを避けられる
+            with os.scandir(self.config.input_dir) as entries:
+                txt_files = [e.name for e in entries
+                             if e.is_file() and e.name.lower().endswith('.txt')]
             
             self.logger.info(f"{len(txt_files)}個のテキストファイルが見つかりました")
             return txt_files
@@ -174,38 +465,143 @@ class EmailCleaner:
         Returns:
             処理成功時True、失敗時False
         """
-        input_path = Path(self.config.get_input_dir()) / filename
-        output_path = Path(self.config.get_output_dir()) / filename
-        encoding = self.config.get_encoding()
+        _, error, warnings = _process_one(self.config.input_dir, self.config.output_dir,
+                                          self.config.encoding, self.config.keywords, filename)
+        return self._record_result(filename, error, warnings)
+    
+    def _record_result(self, filename: str, error: Optional[str],
+                       warnings: Iterable[str] = ()) -> bool:
+        """
+        ファイル処理の結果をログに記録し、件数を更新する
         
-        try:
-            # ファイル読み込み
-            with open(input_path, "r", encoding=encoding) as infile:
-                raw_text = infile.read()
-            
-            # テキスト整形
-            cleaned_text = self.clean_quoted_email(raw_text)
-            
-            # ファイル書き込み
-            with open(output_path, "w", encoding=encoding) as outfile:
-                outfile.write(cleaned_text)
+        Args:
+            filename: 処理したファイル名
+            error: エラーメッセージ（成功時はNone）
+            warnings: 整形中の警告メッセージ
             
-            self.logger.info(f"'{filename}' を処理して出力ディレクトリに保存しました")
+        Returns:
+            処理成功時True、失敗時False
+        """
+        for warning in warnings:
+            self.logger.warning("%s: %s", warning, filename)
+        
+        if error is None:
+            self.logger.info("'%s' を処理して出力ディレクトリに保存しました", filename)
             self.processed_count += 1
             return True
-            
-        except FileNotFoundError:
-            self.logger.error(f"ファイルが見つかりません: {filename}")
-        except PermissionError:
-            self.logger.error(f"ファイルアクセス権限がありません: {filename}")
-        except UnicodeDecodeError:
-            self.logger.error(f"文字エンコーディングエラー: {filename} (エンコーディング: {encoding})")
-        except Exception as e:
-            self.logger.error(f"'{filename}' の処理中に予期しないエラーが発生しました: {e}")
         
+        self.logger.error(error)
         self.error_count += 1
         return False
     
+    def _process_files_parallel(self, filenames: List[str]):
+        """
+        複数ファイルをプロセスプールで並列に処理する
+        
+        Args:
+            filenames: 処理対象のファイル名リスト
+        """
+        max_workers = min(os.cpu_count() or 1, len(filenames))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_process_one, self.config.input_dir, self.config.output_dir,
+                                self.config.encoding, self.config.keywords, filename): filename
+                for filename in filenames
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                filename = futures[future]
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("処理済み (%d/%d): %s", i, len(filenames), filename)
+                try:
+                    _, error, warnings = future.result()
+                except Exception as e:
+                    error = f"'{filename}' の処理中に予期しないエラーが発生しました: {e}"
+                    warnings = []
+                self._record_result(filename, error, warnings)
+    
+    def _process_files_pipelined(self, filenames: List[str]):
+        """
+        読み込み・整形・書き込みをパイプライン化して処理する
+        
+        読み込みと書き込みを別スレッドで行い、ディスクI/Oの待ち時間を
+        メインスレッドでの整形処理と重ねる
+        
+        Args:
+            filenames: 処理対象のファイル名リスト
+        """
+        input_dir = self.config.input_dir
+        output_dir = self.config.output_dir
+        encoding = self.config.encoding
+        keyword_pattern = self.config.keyword_pattern
+        
+        # キューの長さを制限してメモリ使用量を抑える
+        read_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_DEPTH)
+        write_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_DEPTH)
+        # 整形が中断された場合に、読み込み・書き込みスレッドを止める
+        stop = threading.Event()
+        
+        def read_files():
+            try:
+                for filename in filenames:
+                    if stop.is_set():
+                        break
+                    try:
+                        item = (filename, _read_file(input_dir / filename, encoding), None)
+                    except Exception as e:
+                        item = (filename, None, _describe_error(e, filename, encoding))
+                    read_queue.put(item)
+            finally:
+                read_queue.put(None)
+        
+        def write_files():
+            done = 0
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    return
+                if stop.is_set():
+                    continue  # 中断後は残りのファイルを書き込まない
+                filename, cleaned_text, error, warnings = item
+                if error is None:
+                    try:
+                        _write_file(output_dir / filename, cleaned_text, encoding)
+                    except Exception as e:
+                        error = _describe_error(e, filename, encoding)
+                done += 1
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("処理済み (%d/%d): %s", done, len(filenames), filename)
+                self._record_result(filename, error, warnings)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reader = executor.submit(read_files)
+            writer = executor.submit(write_files)
+            try:
+                while True:
+                    item = read_queue.get()
+                    if item is None:
+                        break
+                    filename, raw_text, error = item
+                    cleaned_text = None
+                    warnings: List[str] = []
+                    if error is None:
+                        cleaned_text = clean_quoted_text(raw_text, keyword_pattern, warnings)
+                    write_queue.put((filename, cleaned_text, error, warnings))
+            except BaseException:
+                # KeyboardInterruptなどで中断した場合は読み込みを止め、
+                # 読み込みスレッドがキューへの追加で待ち続けないように空にする
+                stop.set()
+                while True:
+                    try:
+                        read_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                raise
+            finally:
+                # 書き込みスレッドは常にキューから取り出しているため、終了の合図は必ず届く
+                write_queue.put(None)
+            reader.result()
+            writer.result()
+    
     def backup_original_files(self, filenames: List[str]) -> bool:
         """
         元ファイルをバックアップする
@@ -216,17 +612,23 @@ class EmailCleaner:
         Returns:
             バックアップ成功時True、失敗時False
         """
-        if not self.config.should_backup():
+        if not self.config.backup_original:
             return True
         
         try:
-            backup_dir = Path(self.config.get_input_dir()) / "backup"
+            src_dir = self.config.input_dir
+            backup_dir = src_dir / "backup"
             backup_dir.mkdir(exist_ok=True)
+            backup_mode = self.config.backup_mode
+            if backup_mode == 'hardlink' and _is_same_file(src_dir, self.config.output_dir):
+                # 出力先が入力ディレクトリの場合は元ファイルが上書きされ、
+                # 同じ内容を共有するハードリンクのバックアップも失われるためコピーする
+                self.logger.warning("出力ディレクトリが入力ディレクトリと同じため、"
+                                    "ハードリンクの代わりにコピーでバックアップします")
+                backup_mode = 'copy'
             
             for filename in filenames:
-                src = Path(self.config.get_input_dir()) / filename
-                dst = backup_dir / filename
-                shutil.copy2(src, dst)
+                _backup_file(src_dir / filename, backup_dir / filename, backup_mode)
             
             self.logger.info(f"{len(filenames)}個のファイルをバックアップしました")
             return True
@@ -260,14 +662,16 @@ class EmailCleaner:
             削除成功時True、失敗時False
         """
         try:
-            input_dir = Path(self.config.get_input_dir())
+            input_dir = os.fspath(self.config.input_dir)
             deleted_count = 0
             
             for filename in filenames:
-                file_path = input_dir / filename
-                if file_path.exists():
-                    file_path.unlink()
+                # 存在確認をせずに削除し、既にない場合だけを無視する
+                try:
+                    os.unlink(os.path.join(input_dir, filename))
                     deleted_count += 1
+                except FileNotFoundError:
+                    pass
             
             self.logger.info(f"{deleted_count}個のファイルを削除しました")
             return True
@@ -297,15 +701,21 @@ class EmailCleaner:
             return self.processed_count, self.error_count
         
         # バックアップ作成
-        if self.config.should_backup():
+        if self.config.backup_original:
             self.backup_original_files(txt_files)
         
         # ファイル処理
         self.logger.info(f"{len(txt_files)}個のファイルの処理を開始します...")
         
-        for i, filename in enumerate(txt_files, 1):
-            self.logger.info(f"処理中 ({i}/{len(txt_files)}): {filename}")
-            self.process_single_file(filename)
+        if len(txt_files) < 2:
+            for i, filename in enumerate(txt_files, 1):
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("処理中 (%d/%d): %s", i, len(txt_files), filename)
+                self.process_single_file(filename)
+        elif self.config.executor == 'thread':
+            self._process_files_pipelined(txt_files)
+        else:
+            self._process_files_parallel(txt_files)
         
         # 処理結果報告
         self.logger.info(f"処理完了: 成功 {self.processed_count}件, エラー {self.error_count}件")
@@ -322,24 +732,94 @@ class EmailCleaner:
         return self.processed_count, self.error_count
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    書き込みバッファを大きくしたFileHandler
+    
+    レコードごとのフラッシュを行わず、WARNING以上のレコードと終了時
+    （logging.shutdown）にまとめて書き出すことで、書き込み回数を減らす
+    """
+    
+    def __init__(self, filename: str, encoding: Optional[str] = None,
+                 buffer_size: int = 1 << 16):
+        self.buffer_size = buffer_size
+        self._defer_flush = False
+        super().__init__(filename, encoding=encoding)
+        _buffered_handlers.add(self)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record: logging.LogRecord):
+        # StreamHandler.emitはレコードごとにflush()を呼ぶため、WARNING未満では省く
+        # （emitはハンドラーのロックを取得した状態で呼ばれる）
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
+
+
+# 生成済みのBufferedFileHandler（ハンドラーの破棄を妨げないように弱参照で保持する）
+_buffered_handlers: 'weakref.WeakSet[BufferedFileHandler]' = weakref.WeakSet()
+
+
+def _flush_buffered_handlers():
+    """子プロセスに未書き出しのバッファが引き継がれて重複しないように書き出す"""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_flush_buffered_handlers)
+
+
+# ログの出力形式
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# setup_logging()が追加したハンドラー
+_log_handlers: List[logging.Handler] = []
+
+
 def setup_logging(log_level: str = 'INFO'):
-    """ログ設定を行う"""
+    """
+    ログ設定を行う
+    
+    ログレベルはこのモジュールのロガーと追加したハンドラーにだけ設定し、
+    組み込み先のアプリケーションのルートロガーの設定は変更しない
+    """
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
         raise ValueError(f'Invalid log level: {log_level}')
     
-    logging.basicConfig(
-        level=numeric_level,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('email_cleaner.log', encoding='utf-8')
-        ]
-    )
+    logger.setLevel(numeric_level)
+    
+    # 2回目以降の呼び出しではハンドラーを作り直さず、ログレベルだけを変更する
+    if not _log_handlers:
+        file_handler = BufferedFileHandler('email_cleaner.log', encoding='utf-8')
+        if logging.getLogger().handlers:
+            # ルートロガーが設定済み（他のアプリケーションに組み込まれている）の場合は、
+            # 画面への出力は既存のハンドラーに任せ、ログファイルだけを追加する
+            file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+            logger.addHandler(file_handler)
+            _log_handlers.append(file_handler)
+        else:
+            handlers = [logging.StreamHandler(), file_handler]
+            logging.basicConfig(level=numeric_level, format=_LOG_FORMAT, handlers=handlers)
+            _log_handlers.extend(handlers)
+    
+    for handler in _log_handlers:
+        handler.setLevel(numeric_level)
 
 
-def main():
-    """メイン処理"""
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを作成する（繰り返し実行する場合は使い回す）"""
     parser = argparse.ArgumentParser(
         description='メール引用テキスト整形プログラム',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -364,17 +844,67 @@ def main():
         help='ログレベル (デフォルト: INFO)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+# 設定ファイルのパスごとの(更新時刻, 設定)のキャッシュ
+_config_cache: Dict[str, Tuple[int, EmailCleanerConfig]] = {}
+
+
+def load_config(config_file: str) -> EmailCleanerConfig:
+    """
+    設定を読み込む
+    
+    設定ファイルが前回の読み込みから更新されていなければ、読み込み済みの設定を返す
+    
+    Args:
+        config_file: 設定ファイルのパス
+        
+    Returns:
+        設定
+    """
+    try:
+        mtime = os.stat(config_file).st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    cached = _config_cache.get(config_file)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    config = EmailCleanerConfig(config_file)
+    try:
+        # 設定ファイルが新規作成された場合も含めて、読み込み後の更新時刻で記録する
+        _config_cache[config_file] = (os.stat(config_file).st_mtime_ns, config)
+    except OSError:
+        _config_cache.pop(config_file, None)
+    return config
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """
+    引数を指定して処理を実行する（外部のスクリプトから繰り返し呼び出せる）
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argvを使う）
+        
+    Returns:
+        終了コード
+    """
+    try:
+        args = build_parser().parse_args(argv)
+    except SystemExit as e:
+        # 引数の誤り（2）や--help（0）でもプロセスを終了せず、終了コードを返す
+        return e.code if isinstance(e.code, int) else 2
     
     try:
         # ログ設定
         setup_logging(args.log_level)
-        logger = logging.getLogger(__name__)
         
         logger.info("メール引用テキスト整形プログラムを開始します")
         
         # 設定読み込み
-        config = EmailCleanerConfig(args.config)
+        config = load_config(args.config)
         
         # メイン処理実行
         cleaner = EmailCleaner(config)
@@ -394,9 +924,14 @@ def main():
         print("\n処理が中断されました")
         return 130
     except Exception as e:
-        logging.error(f"予期しないエラーが発生しました: {e}")
+        logger.error(f"予期しないエラーが発生しました: {e}")
         return 1
 
 
+def main():
+    """メイン処理"""
+    return run()
+
+
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())